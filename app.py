@@ -7,11 +7,15 @@ from slack_bolt.adapter.socket_mode import SocketModeHandler
 # Load environment variables from .env file
 load_dotenv()
 
+# Both tokens are required; fail fast at import if either is missing
+SLACK_BOT_TOKEN = os.environ["SLACK_BOT_TOKEN"]
+SLACK_APP_TOKEN = os.environ["SLACK_APP_TOKEN"]
+
 
 def main() -> None:
     """Main entry point for the EntroPick application."""
-    app = App(token=os.environ.get("SLACK_BOT_TOKEN"))
-    SocketModeHandler(app, os.environ["SLACK_APP_TOKEN"]).start()
+    app = App(token=SLACK_BOT_TOKEN)
+    SocketModeHandler(app, SLACK_APP_TOKEN).start()
 
 
 if __name__ == "__main__":